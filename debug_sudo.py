@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 import os
+import shutil
 import subprocess
+import sys
 
 # Debug script to understand sudo behavior
 
+def run_sudo(args):
+    try:
+        return subprocess.run(['sudo', '-A'] + args,
+                              capture_output=True, text=True, timeout=5)
+    except subprocess.TimeoutExpired:
+        print("sudo timed out after 5 seconds")
+        return None
+
 print("=== Sudo Askpass Debug ===")
 print(f"Current directory: {os.getcwd()}")
 print(f"SUDO_ASKPASS: {os.environ.get('SUDO_ASKPASS', 'Not set')}")
 print()
 
+if not shutil.which('sudo'):
+    print("sudo not found in PATH, skipping sudo -A checks")
+    sys.exit(0)
+
+if os.geteuid() == 0:
+    print("Running as root, sudo will not invoke askpass, skipping sudo -A checks")
+    sys.exit(0)
+
 # Change to restricted directory
 os.chdir('/opt')
 print(f"Changed to: {os.getcwd()}")
@@ -16,11 +34,11 @@ print()
 
 # Try running sudo with askpass
 print("Attempting sudo -A command...")
-result = subprocess.run(['sudo', '-A', 'echo', 'test'], 
-                       capture_output=True, text=True)
-print(f"Return code: {result.returncode}")
-print(f"Stdout: {result.stdout}")
-print(f"Stderr: {result.stderr}")
+result = run_sudo(['echo', 'test'])
+if result:
+    print(f"Return code: {result.returncode}")
+    print(f"Stdout: {result.stdout}")
+    print(f"Stderr: {result.stderr}")
 print()
 
 # Check what directory askpass sees
@@ -35,6 +53,6 @@ os.chmod('/tmp/test_askpass.py', 0o755)
 
 # Temporarily use test askpass
 os.environ['SUDO_ASKPASS'] = '/tmp/test_askpass.py'
-result = subprocess.run(['sudo', '-A', 'echo', 'test'], 
-                       capture_output=True, text=True)
-print(result.stderr)
\ No newline at end of file
+result = run_sudo(['echo', 'test'])
+if result:
+    print(result.stderr)
\ No newline at end of file